@@ -2,12 +2,36 @@ import json
 import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _parse_json_file(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    if orjson is not None:
+        with open(path_str, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path_str, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_json_file(path: Path) -> Dict[str, Any]:
+    """
+    Load a JSON config file once per process
+    Parsed result is cached by path + mtime, so services and workers share one
+    dict and an edited file is picked up again. Treat the result as read-only.
+    """
+    return _parse_json_file(str(path), path.stat().st_mtime_ns)
+
+
 def load_env_file(env_path: Path) -> None:
     """
     Load .env file manually with proper handling of special characters
@@ -536,10 +560,9 @@ class Config:
             if not path.exists():
                 return {}
 
-            with open(path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                logger.info(f"Loaded config from {path}")
-                return config
+            config = load_json_file(path)
+            logger.info(f"Loaded config from {path}")
+            return config
 
         except FileNotFoundError:
             logger.debug(f"Config file not found: {filename} (optional)")
@@ -3,6 +3,7 @@ import json
 import os
 from pathlib import Path
 from typing import List, Dict, Optional
+from config import load_json_file
 from services.connection_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
@@ -17,10 +18,9 @@ class DatabaseManager:
 
         try:
             config_path = Path(__file__).parent / "config" / "api_config.json"
-            with open(config_path, "r", encoding="utf-8") as f:
-                api_config = json.load(f)
-                self.db_msgs = api_config.get("database_messages", {})
-                self.log_msgs = api_config.get("log_messages", {})
+            api_config = load_json_file(config_path)
+            self.db_msgs = api_config.get("database_messages", {})
+            self.log_msgs = api_config.get("log_messages", {})
         except Exception as e:
             logger.warning(f"Could not load api_config.json: {e}")
             self.db_msgs = {}
@@ -25,7 +25,7 @@ from config import Config
 from database import DatabaseManager
 from routes.admin import setup_admin_routes
 from routes.feedback import setup_feedback_routes
-from routes.health import setup_health_routes
+from routes.health import setup_health_routes, close_health_http_client
 from routes.announcements import setup_announcement_routes
 from routes.generate import setup_generate_routes
 from services.auth_service import AuthService
@@ -170,6 +170,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Error closing database: {e}")
 
+    try:
+        await close_health_http_client()
+    except Exception as e:
+        logger.error(f"❌ Error closing HTTP client: {e}")
+
     logger.info("=" * 60)
     shutdown_msg = startup_msgs.get("shutdown_complete", "Shutdown complete")
     logger.info(f"✅ {shutdown_msg}")
@@ -5,8 +5,8 @@ Prevents API abuse and ensures fair resource usage
 
 import time
 import logging
-from typing import Dict, Tuple
-from collections import defaultdict
+from typing import Tuple
+from collections import OrderedDict
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
 import threading
@@ -26,13 +26,13 @@ class TokenBucket:
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = capacity
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
         self.lock = threading.Lock()
 
     def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens, return True if successful"""
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
             # Refill tokens based on time elapsed
             elapsed = now - self.last_refill
             self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
@@ -70,15 +70,10 @@ class RateLimiter:
         self.requests_per_hour = requests_per_hour
         self.cleanup_interval = cleanup_interval
 
-        # Per-IP buckets (IP -> (minute_bucket, hour_bucket))
-        self.buckets: Dict[str, Tuple[TokenBucket, TokenBucket]] = defaultdict(
-            lambda: (
-                TokenBucket(requests_per_minute, requests_per_minute / 60.0),
-                TokenBucket(requests_per_hour, requests_per_hour / 3600.0),
-            )
-        )
+        # Per-IP buckets (IP -> (minute_bucket, hour_bucket)), least recently seen first
+        self.buckets: "OrderedDict[str, Tuple[TokenBucket, TokenBucket]]" = OrderedDict()
 
-        self.last_cleanup = time.time()
+        self.last_cleanup = time.monotonic()
         self.lock = threading.Lock()
 
         logger.info(
@@ -87,26 +82,40 @@ class RateLimiter:
 
     def _cleanup_old_buckets(self):
         """Remove buckets for IPs that haven't been seen recently"""
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_cleanup < self.cleanup_interval:
             return
 
         with self.lock:
-            # Remove buckets older than 2 hours
-            old_ips = [
-                ip
-                for ip, (minute_bucket, _) in self.buckets.items()
-                if now - minute_bucket.last_refill > 7200
-            ]
-
-            for ip in old_ips:
+            # Remove buckets older than 2 hours - buckets are kept in recency
+            # order, so stop at the first one that is still fresh
+            removed = 0
+            while self.buckets:
+                ip, (minute_bucket, _) = next(iter(self.buckets.items()))
+                if now - minute_bucket.last_refill <= 7200:
+                    break
                 del self.buckets[ip]
+                removed += 1
 
-            if old_ips:
-                logger.info(f"Cleaned up {len(old_ips)} old rate limit buckets")
+            if removed:
+                logger.info(f"Cleaned up {removed} old rate limit buckets")
 
             self.last_cleanup = now
 
+    def _get_buckets(self, client_ip: str) -> Tuple[TokenBucket, TokenBucket]:
+        """Get or create buckets for an IP and mark it as most recently seen"""
+        with self.lock:
+            buckets = self.buckets.get(client_ip)
+            if buckets is None:
+                buckets = (
+                    TokenBucket(self.requests_per_minute, self.requests_per_minute / 60.0),
+                    TokenBucket(self.requests_per_hour, self.requests_per_hour / 3600.0),
+                )
+                self.buckets[client_ip] = buckets
+            else:
+                self.buckets.move_to_end(client_ip)
+            return buckets
+
     def check_rate_limit(self, client_ip: str) -> Tuple[bool, float]:
         """
         Check if request is within rate limit
@@ -116,7 +125,7 @@ class RateLimiter:
         """
         self._cleanup_old_buckets()
 
-        minute_bucket, hour_bucket = self.buckets[client_ip]
+        minute_bucket, hour_bucket = self._get_buckets(client_ip)
 
         # Check minute limit first
         if not minute_bucket.consume():
@@ -160,8 +169,9 @@ class LoginRateLimiter:
         self.cleanup_interval = cleanup_interval
 
         # Track failed attempts per IP: IP -> [(timestamp1, timestamp2, ...)]
-        self.attempts: Dict[str, list] = defaultdict(list)
-        self.last_cleanup = time.time()
+        # Ordered by each IP's latest attempt, oldest first
+        self.attempts: "OrderedDict[str, list]" = OrderedDict()
+        self.last_cleanup = time.monotonic()
         self.lock = threading.Lock()
 
         logger.info(
@@ -170,19 +180,19 @@ class LoginRateLimiter:
 
     def _cleanup_old_attempts(self):
         """Remove expired login attempts"""
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_cleanup < self.cleanup_interval:
             return
 
         with self.lock:
-            # Remove attempts older than lockout duration
-            for ip in list(self.attempts.keys()):
-                self.attempts[ip] = [
-                    t for t in self.attempts[ip] if now - t < self.lockout_duration
-                ]
-                # Remove IP if no recent attempts
-                if not self.attempts[ip]:
-                    del self.attempts[ip]
+            # Remove IPs whose latest attempt is older than lockout duration -
+            # every IP uses the same window, so expiry order equals attempt
+            # order and the sweep can stop at the first IP that is still live
+            while self.attempts:
+                ip, timestamps = next(iter(self.attempts.items()))
+                if timestamps and now - timestamps[-1] < self.lockout_duration:
+                    break
+                del self.attempts[ip]
 
             self.last_cleanup = now
 
@@ -199,17 +209,18 @@ class LoginRateLimiter:
         self._cleanup_old_attempts()
 
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
 
             # Clean old attempts for this IP
-            self.attempts[client_ip] = [
-                t for t in self.attempts[client_ip] if now - t < self.lockout_duration
+            attempts = [
+                t for t in self.attempts.get(client_ip, ()) if now - t < self.lockout_duration
             ]
 
-            current_attempts = len(self.attempts[client_ip])
+            current_attempts = len(attempts)
 
             if current_attempts >= self.max_attempts:
-                oldest_attempt = min(self.attempts[client_ip])
+                self.attempts[client_ip] = attempts
+                oldest_attempt = min(attempts)
                 time_since_oldest = now - oldest_attempt
                 remaining_lockout = self.lockout_duration - time_since_oldest
 
@@ -221,7 +232,9 @@ class LoginRateLimiter:
                 return False, 0
 
             # Record this attempt
-            self.attempts[client_ip].append(now)
+            attempts.append(now)
+            self.attempts[client_ip] = attempts
+            self.attempts.move_to_end(client_ip)
             remaining = self.max_attempts - (current_attempts + 1)
 
             return True, remaining
@@ -229,7 +242,7 @@ class LoginRateLimiter:
     def get_lockout_time(self, client_ip: str) -> float:
         """Get remaining lockout time in seconds"""
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
 
             if client_ip not in self.attempts:
                 return 0.0
@@ -3,9 +3,9 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 import logging
-import json
 import os
 from pathlib import Path
+from config import load_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +17,7 @@ api_config_path = config_dir / api_config_file if config_dir and api_config_file
 
 try:
     if api_config_path and api_config_path.exists():
-        with open(api_config_path, "r", encoding="utf-8") as f:
-            api_config = json.load(f)
+        api_config = load_json_file(api_config_path)
         MESSAGES = api_config.get("response_messages", {})
         ERROR_MESSAGES = api_config.get("error_messages", {})
     else:
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import uuid
 import base64
@@ -100,7 +101,9 @@ def setup_generate_routes(app, image_generation_service, config=None):
                     status_code=500,
                     detail=detail_msg
                 )
-            image_b64 = base64.b64encode(generated_image).decode('utf-8')
+            image_b64 = await asyncio.to_thread(
+                lambda: base64.b64encode(generated_image).decode('utf-8')
+            )
             image_data_url = f"data:image/png;base64,{image_b64}"
             logger.info(f"✅ Image generated successfully!")
             logger.info(f"   Output size: {len(generated_image) / 1024:.2f} KB")
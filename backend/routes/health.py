@@ -1,14 +1,41 @@
 from fastapi import APIRouter
 from datetime import datetime
+import httpx
 import logging
-import json
 import os
 from pathlib import Path
+from typing import Optional
+from config import load_json_file
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Shared client for /health/ai so repeated probes reuse the TLS connection
+_hf_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_hf_client(config) -> httpx.AsyncClient:
+    global _hf_client
+    if _hf_client is None or _hf_client.is_closed:
+        _hf_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=5.0),
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {config.huggingface_api_token}",
+            },
+        )
+    return _hf_client
+
+
+async def close_health_http_client():
+    """Close the shared HuggingFace probe client (called on app shutdown)"""
+    global _hf_client
+    if _hf_client is not None:
+        await _hf_client.aclose()
+        _hf_client = None
+
 
 def setup_health_routes(
     app, config, db_manager, image_service
@@ -28,8 +55,7 @@ def setup_health_routes(
 
     try:
         if api_config_path.exists():
-            with open(api_config_path, "r", encoding="utf-8") as f:
-                api_config = json.load(f)
+            api_config = load_json_file(api_config_path)
             endpoints = api_config.get("endpoints", {})
             app_info = api_config.get("app_info", {})
         else:
@@ -113,8 +139,6 @@ def setup_health_routes(
     @router.get("/health/ai")
     async def ai_health_check():
         """Test HuggingFace API connection"""
-        import httpx
-
         health = {
             "timestamp": datetime.utcnow().isoformat(),
             "provider": "HuggingFace",
@@ -124,36 +148,30 @@ def setup_health_routes(
         }
 
         try:
-            timeout = httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=5.0)
-
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    f"{config.huggingface_base_url}/{config.huggingface_model}",
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": f"Bearer {config.huggingface_api_token}",
-                    },
-                    json={
-                        "inputs": "test"
-                    }
-                )
-
-                if response.status_code == 200:
-                    health["status"] = "connected"
-                    health["message"] = "✅ HuggingFace API is working"
-                    logger.info("✅ HuggingFace API health check passed")
-                elif response.status_code == 401:
-                    health["status"] = "auth_failed"
-                    health["message"] = "❌ Authentication failed - check HUGGINGFACE_API_TOKEN"
-                    logger.error("❌ HuggingFace API authentication failed")
-                elif response.status_code == 429:
-                    health["status"] = "rate_limited"
-                    health["message"] = "⚠️ Rate limited - API is working but quota exceeded"
-                    logger.warning("⚠️ HuggingFace API rate limited")
-                else:
-                    health["status"] = "error"
-                    health["message"] = f"❌ HTTP {response.status_code}"
-                    logger.error(f"❌ HuggingFace API returned {response.status_code}")
+            client = _get_hf_client(config)
+            response = await client.post(
+                f"{config.huggingface_base_url}/{config.huggingface_model}",
+                json={
+                    "inputs": "test"
+                }
+            )
+
+            if response.status_code == 200:
+                health["status"] = "connected"
+                health["message"] = "✅ HuggingFace API is working"
+                logger.info("✅ HuggingFace API health check passed")
+            elif response.status_code == 401:
+                health["status"] = "auth_failed"
+                health["message"] = "❌ Authentication failed - check HUGGINGFACE_API_TOKEN"
+                logger.error("❌ HuggingFace API authentication failed")
+            elif response.status_code == 429:
+                health["status"] = "rate_limited"
+                health["message"] = "⚠️ Rate limited - API is working but quota exceeded"
+                logger.warning("⚠️ HuggingFace API rate limited")
+            else:
+                health["status"] = "error"
+                health["message"] = f"❌ HTTP {response.status_code}"
+                logger.error(f"❌ HuggingFace API returned {response.status_code}")
 
         except httpx.ConnectError as e:
             health["status"] = "connection_failed"
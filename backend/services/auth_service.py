@@ -1,11 +1,54 @@
 import jwt
-import secrets
+import hmac
+import base64
+import binascii
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Max number of verified tokens kept in memory
+VERIFY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=512)
+def _decode_unverified(token: str) -> Dict:
+    """
+    Decode JWT header/payload segments without checking signature or expiry
+    Cached because expiry inspection polls the same token repeatedly.
+    Returned dict is shared between callers - treat it as read-only.
+    """
+    return jwt.decode(token, options={"verify_signature": False})
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment"""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+@lru_cache(maxsize=8)
+def _is_plain_hs256_header(header_segment: str) -> bool:
+    """
+    True if the JWT header is a plain HS256 header the fast path can handle
+    Tokens from generate_token all share one header, so this is nearly always a cache hit.
+    """
+    try:
+        header = json.loads(_b64url_decode(header_segment))
+    except (ValueError, binascii.Error):
+        return False
+    return (
+        isinstance(header, dict)
+        and header.get("alg") == "HS256"
+        and header.keys() <= {"alg", "typ"}
+    )
+
 
 class AuthService:
     """
@@ -17,7 +60,24 @@ class AuthService:
         self.admin_password = admin_password
         self.jwt_secret = jwt_secret
         self.algorithm = "HS256"
+        # Prepared once: HS256 key bytes and the allowed-algorithms list passed to PyJWT
+        self._jwt_key_bytes = (jwt_secret or "").encode('utf-8')
+        self._algorithms = [self.algorithm]
+        # HMAC keyed once; each verification copies it instead of redoing the key setup
+        self._hmac_template = hmac.new(self._jwt_key_bytes, None, hashlib.sha256)
         self.token_expiry_hours = min(token_expiry_hours, 24)
+        self._expiry_seconds = self.token_expiry_hours * 3600
+
+        # Admin password is compared as a fixed-length HMAC digest (no length leak)
+        self._admin_pw_mac = (
+            hmac.new(self._jwt_key_bytes, admin_password.encode('utf-8'), hashlib.sha256).digest()
+            if admin_password
+            else None
+        )
+
+        # sha256(token) -> (payload, exp); only successfully verified tokens are cached
+        self._verify_cache: "OrderedDict[bytes, Tuple[Dict, float]]" = OrderedDict()
+        self._verify_cache_lock = threading.Lock()
         
         if not self.admin_password or len(self.admin_password) < 8:
             logger.warning("⚠️  Admin password is weak or not set!")
@@ -38,16 +98,14 @@ class AuthService:
             bool: True if password matches
         """
         try:
-            if not password or not self.admin_password:
+            if not password or not self._admin_pw_mac:
                 return False
 
             # Use constant-time comparison to prevent timing attacks
-            # secrets.compare_digest ensures the comparison takes the same time
-            # regardless of where the strings differ
-            is_valid = secrets.compare_digest(
-                password.encode('utf-8'),
-                self.admin_password.encode('utf-8')
-            )
+            # Both sides are 32-byte HMAC-SHA256 digests, so neither the position
+            # of the first difference nor the password length affects timing
+            candidate = hmac.new(self._jwt_key_bytes, password.encode('utf-8'), hashlib.sha256).digest()
+            is_valid = hmac.compare_digest(candidate, self._admin_pw_mac)
 
             if is_valid:
                 logger.info("✅ Admin password verified")
@@ -71,20 +129,21 @@ class AuthService:
             str: JWT token
         """
         try:
-            expiry = datetime.utcnow() + timedelta(hours=self.token_expiry_hours)
+            now = int(time.time())
+            expiry = now + self._expiry_seconds
             
             payload = {
                 "role": "admin",
                 "exp": expiry,
-                "iat": datetime.utcnow(),
+                "iat": now,
             }
             
             if additional_claims:
                 payload.update(additional_claims)
             
-            token = jwt.encode(payload, self.jwt_secret, algorithm=self.algorithm)
+            token = jwt.encode(payload, self._jwt_key_bytes, algorithm=self.algorithm)
             
-            logger.info(f"🎫 Generated admin token (expires: {expiry.isoformat()})")
+            logger.info(f"🎫 Generated admin token (expires: {datetime.utcfromtimestamp(expiry).isoformat()})")
             
             return token
             
@@ -92,9 +151,77 @@ class AuthService:
             logger.error(f"Token generation error: {e}")
             raise
 
+    def _get_cached_payload(self, cache_key: bytes) -> Optional[Dict]:
+        """Return a copy of a cached payload if the token has not expired yet"""
+        with self._verify_cache_lock:
+            cached = self._verify_cache.get(cache_key)
+            if cached is None:
+                return None
+
+            payload, expires_at = cached
+            if expires_at <= time.time():
+                del self._verify_cache[cache_key]
+                return None
+
+            self._verify_cache.move_to_end(cache_key)
+            return dict(payload)
+
+    def _cache_payload(self, cache_key: bytes, payload: Dict):
+        """Cache a verified payload until its own exp claim (LRU bounded)"""
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+
+        with self._verify_cache_lock:
+            self._verify_cache[cache_key] = (dict(payload), float(expires_at))
+            self._verify_cache.move_to_end(cache_key)
+            if len(self._verify_cache) > VERIFY_CACHE_SIZE:
+                self._verify_cache.popitem(last=False)
+
+    def _verify_hs256(self, signing_input: bytes, signature: bytes) -> bool:
+        """Check an HS256 signature using the pre-keyed HMAC template"""
+        mac = self._hmac_template.copy()
+        mac.update(signing_input)
+        return hmac.compare_digest(mac.digest(), signature)
+
+    def _fast_decode(self, token: str) -> Optional[Dict]:
+        """
+        Verify a plain HS256 token without going through PyJWT
+        Only accepts the token shape produced by generate_token (int exp in the
+        future, no nbf/aud). Returns None whenever PyJWT should make the call instead,
+        so rejections still get PyJWT's exceptions and log messages.
+        """
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            if not _is_plain_hs256_header(header_segment):
+                return None
+
+            signing_input = f"{header_segment}.{payload_segment}".encode("ascii")
+            if not self._verify_hs256(signing_input, _b64url_decode(signature_segment)):
+                return None
+
+            payload = json.loads(_b64url_decode(payload_segment))
+        except (ValueError, UnicodeEncodeError, binascii.Error):
+            return None
+
+        if not isinstance(payload, dict) or "nbf" in payload or "aud" in payload:
+            return None
+
+        now = time.time()
+        exp = payload.get("exp")
+        iat = payload.get("iat")
+        if type(exp) is not int or exp <= now:
+            return None
+        if iat is not None and (type(iat) is not int or iat > now):
+            return None
+
+        return payload
+
     def verify_token(self, token: str) -> Optional[Dict]:
         """
         Verify and decode JWT token
+        Verified tokens are cached until their exp claim so repeated requests with
+        the same bearer token skip signature verification. Failures are never cached.
         
         Args:
             token: JWT token to verify
@@ -105,17 +232,25 @@ class AuthService:
         try:
             if not token:
                 return None
+
+            cache_key = hashlib.sha256(token.encode('utf-8')).digest()
+            cached_payload = self._get_cached_payload(cache_key)
+            if cached_payload is not None:
+                return cached_payload
             
-            payload = jwt.decode(
-                token, 
-                self.jwt_secret, 
-                algorithms=[self.algorithm]
-            )
+            payload = self._fast_decode(token)
+            if payload is None:
+                payload = jwt.decode(
+                    token, 
+                    self._jwt_key_bytes,
+                    algorithms=self._algorithms
+                )
             
             if payload.get("role") != "admin":
                 logger.warning("❌ Token role is not admin")
                 return None
             
+            self._cache_payload(cache_key, payload)
             logger.debug("✅ Token verified successfully")
             return payload
             
@@ -164,6 +299,7 @@ class AuthService:
     def is_token_expired(self, token: str) -> bool:
         """
         Check if token is expired
+        Reads the exp claim only - use verify_token to authenticate a token
         
         Args:
             token: Token to check
@@ -172,23 +308,19 @@ class AuthService:
             bool: True if expired
         """
         try:
-            jwt.decode(
-                token,
-                self.jwt_secret,
-                algorithms=[self.algorithm]
-            )
-            return False
-
-        except jwt.ExpiredSignatureError:
-            return True
+            exp_timestamp = _decode_unverified(token).get("exp")
+            if exp_timestamp is None:
+                return False
+            return exp_timestamp <= time.time()
 
-        except (jwt.InvalidTokenError, jwt.DecodeError) as e:
+        except (jwt.InvalidTokenError, jwt.DecodeError, TypeError) as e:
             logger.warning(f"Token validation error: {e}")
             return True
 
     def get_token_expiry(self, token: str) -> Optional[datetime]:
         """
         Get token expiry time
+        Reads the exp claim only - use verify_token to authenticate a token
         
         Args:
             token: Token to check
@@ -197,14 +329,7 @@ class AuthService:
             Optional[datetime]: Expiry time if valid
         """
         try:
-            payload = jwt.decode(
-                token, 
-                self.jwt_secret, 
-                algorithms=[self.algorithm],
-                options={"verify_exp": False}
-            )
-            
-            exp_timestamp = payload.get("exp")
+            exp_timestamp = _decode_unverified(token).get("exp")
 
             if exp_timestamp:
                 # Use utcfromtimestamp to match utcnow() used in token generation
@@ -24,84 +24,91 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
         self.name = name
+        self._recovery_timeout_ns = int(recovery_timeout * 1_000_000_000)
+        self._open_msg = f"Circuit breaker '{name}' is open"
 
         self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
+        # time.monotonic_ns() of the last failure - immune to wall-clock jumps
+        self.last_failure_ns: Optional[int] = None
         self.state = CircuitState.CLOSED
 
     def _should_attempt_reset(self) -> bool:
-        if self.state != CircuitState.OPEN:
+        if self.state is not CircuitState.OPEN:
             return False
-        if self.last_failure_time is None:
+        if self.last_failure_ns is None:
             return False
-        return (time.time() - self.last_failure_time) >= self.recovery_timeout
+        return (time.monotonic_ns() - self.last_failure_ns) >= self._recovery_timeout_ns
+
+    def _record_failure(self):
+        self.failure_count += 1
+        self.last_failure_ns = time.monotonic_ns()
+
+        # A failed probe in HALF_OPEN and hitting the threshold both trip the breaker
+        if self.state is CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.state = CircuitState.OPEN
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
-        if self.state == CircuitState.OPEN:
+        if self.state is CircuitState.OPEN:
             if self._should_attempt_reset():
                 self.state = CircuitState.HALF_OPEN
             else:
-                wait_time = self.recovery_timeout - (time.time() - (self.last_failure_time or 0))
-                raise CircuitBreakerOpen(f"Circuit breaker '{self.name}' is open")
+                raise CircuitBreakerOpen(self._open_msg)
 
         try:
             result = func(*args, **kwargs)
-            if self.state == CircuitState.HALF_OPEN:
+            if self.state is CircuitState.HALF_OPEN:
                 self.state = CircuitState.CLOSED
                 self.failure_count = 0
             return result
 
         except self.expected_exception:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-
-            if self.state == CircuitState.HALF_OPEN:
-                self.state = CircuitState.OPEN
-            elif self.failure_count >= self.failure_threshold:
-                self.state = CircuitState.OPEN
+            self._record_failure()
             raise
 
     async def call_async(self, func: Callable, *args, **kwargs) -> Any:
-        if self.state == CircuitState.OPEN:
+        # Fast path: a closed breaker only needs to observe failures
+        if self.state is CircuitState.CLOSED:
+            try:
+                return await func(*args, **kwargs)
+            except self.expected_exception:
+                self._record_failure()
+                raise
+
+        if self.state is CircuitState.OPEN:
             if self._should_attempt_reset():
                 self.state = CircuitState.HALF_OPEN
             else:
-                wait_time = self.recovery_timeout - (time.time() - (self.last_failure_time or 0))
-                raise CircuitBreakerOpen(f"Circuit breaker '{self.name}' is open")
+                raise CircuitBreakerOpen(self._open_msg)
 
         try:
             result = await func(*args, **kwargs)
-            if self.state == CircuitState.HALF_OPEN:
+            if self.state is CircuitState.HALF_OPEN:
                 self.state = CircuitState.CLOSED
                 self.failure_count = 0
             return result
 
         except self.expected_exception:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-
-            if self.state == CircuitState.HALF_OPEN:
-                self.state = CircuitState.OPEN
-            elif self.failure_count >= self.failure_threshold:
-                self.state = CircuitState.OPEN
+            self._record_failure()
             raise
 
     def reset(self):
         self.state = CircuitState.CLOSED
         self.failure_count = 0
-        self.last_failure_time = None
+        self.last_failure_ns = None
 
     def get_status(self) -> dict:
+        last_failure_time = None
+        if self.last_failure_ns is not None:
+            # Convert the monotonic timestamp to wall-clock time only for reporting
+            elapsed = (time.monotonic_ns() - self.last_failure_ns) / 1e9
+            last_failure_time = datetime.fromtimestamp(time.time() - elapsed).isoformat()
+
         return {
             "name": self.name,
             "state": self.state.value,
             "failure_count": self.failure_count,
             "failure_threshold": self.failure_threshold,
-            "last_failure_time": (
-                datetime.fromtimestamp(self.last_failure_time).isoformat()
-                if self.last_failure_time
-                else None
-            ),
+            "last_failure_time": last_failure_time,
             "recovery_timeout": self.recovery_timeout,
         }
 
@@ -1,11 +1,14 @@
 import os
 import pyodbc
+import hashlib
 import logging
-import re
-from typing import Optional
-from queue import Queue, Empty
-from threading import Lock
+import random
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from collections import deque
+from threading import Lock, Event, Thread
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 logger = logging.getLogger(__name__)
@@ -16,19 +19,54 @@ class ConnectionPoolExhausted(Exception):
     pass
 
 
+# Characters that force a PWD value to be wrapped in {}
+_SPECIAL_CHARS = frozenset('@!#$%^&*()')
+
+
 # Bug #19 fix - Add connection lifetime management (1 hour default)
 MAX_CONNECTION_LIFETIME = 3600  # seconds (1 hour)
 
+# Borrowed connections are only pinged with SELECT 1 if last checked longer ago than this
+VALIDATION_INTERVAL = 30  # seconds
+
+# Overflow connections are opened this many at a time so a burst finds them ready
+OVERFLOW_BATCH_SIZE = 3
+
+# How often the background reaper closes expired idle connections
+REAPER_INTERVAL = 60  # seconds
+
+# Idle overflow connections (beyond pool_size) unused this long are closed by the reaper
+IDLE_TIMEOUT = 600  # seconds
+
+# Same limits in nanoseconds for the monotonic_ns checks in ConnectionWrapper
+_NS_PER_SECOND = 1_000_000_000
+_MAX_LIFETIME_NS = MAX_CONNECTION_LIFETIME * _NS_PER_SECOND
+_VALIDATION_INTERVAL_NS = VALIDATION_INTERVAL * _NS_PER_SECOND
+_IDLE_TIMEOUT_NS = IDLE_TIMEOUT * _NS_PER_SECOND
+
 
 class ConnectionWrapper:
     """Bug #19 fix - Wrapper to track connection creation time for lifetime management"""
     def __init__(self, connection: pyodbc.Connection):
         self.connection = connection
-        self.created_at = time.time()
+        # time.monotonic_ns() timestamps - integer math, unaffected by wall-clock changes
+        self.created_at_ns = time.monotonic_ns()
+        self.last_validated_ns = self.created_at_ns
+        self.last_returned_ns = self.created_at_ns
+        # ±10% jitter so connections opened together don't all expire together
+        self.max_lifetime_ns = int(_MAX_LIFETIME_NS * random.uniform(0.9, 1.1))
+
+    def is_expired(self) -> bool:
+        """Check if connection has exceeded its (jittered) lifetime"""
+        return (time.monotonic_ns() - self.created_at_ns) > self.max_lifetime_ns
 
-    def is_expired(self, max_lifetime: int = MAX_CONNECTION_LIFETIME) -> bool:
-        """Check if connection has exceeded its lifetime"""
-        return (time.time() - self.created_at) > max_lifetime
+    def needs_validation(self, interval_ns: int = _VALIDATION_INTERVAL_NS) -> bool:
+        """Check if the last successful health check is older than interval"""
+        return (time.monotonic_ns() - self.last_validated_ns) > interval_ns
+
+    def is_idle(self, idle_timeout_ns: int = _IDLE_TIMEOUT_NS) -> bool:
+        """Check if connection has sat unused in the pool longer than idle_timeout"""
+        return (time.monotonic_ns() - self.last_returned_ns) > idle_timeout_ns
 
     def close(self):
         """Close the underlying connection"""
@@ -38,6 +76,59 @@ class ConnectionWrapper:
             logger.debug(f"Error closing connection: {e}")
 
 
+def _find_closing_brace(conn_str: str, start: int) -> int:
+    """Index of the '}' closing a braced value ('}}' is an escaped brace), or -1"""
+    while True:
+        close = conn_str.find('}', start)
+        if close == -1 or conn_str[close + 1:close + 2] != '}':
+            return close
+        start = close + 2
+
+
+def _parse_conn_str(conn_str: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split an ODBC connection string into (key, value) pairs in a single pass
+    Keys and values are stripped; braced values may contain ';'.
+    Non-empty parts without '=' are kept verbatim with value None.
+    """
+    pairs = []
+    i, n = 0, len(conn_str)
+
+    while i < n:
+        end = conn_str.find(';', i)
+        eq = conn_str.find('=', i)
+
+        if eq == -1 or (end != -1 and eq > end):
+            end = n if end == -1 else end
+            part = conn_str[i:end]
+            if part.strip():
+                pairs.append((part, None))
+            i = end + 1
+            continue
+
+        value_start = eq + 1
+        while value_start < n and conn_str[value_start].isspace():
+            value_start += 1
+
+        if conn_str.startswith('{', value_start):
+            close = _find_closing_brace(conn_str, value_start + 1)
+            end = conn_str.find(';', close if close != -1 else value_start)
+        else:
+            end = conn_str.find(';', value_start)
+        if end == -1:
+            end = n
+
+        pairs.append((conn_str[i:eq].strip(), conn_str[value_start:end].strip()))
+        i = end + 1
+
+    return pairs
+
+
+def _join_conn_str(pairs: List[Tuple[str, Optional[str]]]) -> str:
+    """Serialize (key, value) pairs back into a connection string"""
+    return ';'.join(key if value is None else f"{key}={value}" for key, value in pairs)
+
+
 def mask_sensitive_data(conn_str: str) -> str:
     """
     Mask sensitive data in connection string for safe logging
@@ -46,18 +137,27 @@ def mask_sensitive_data(conn_str: str) -> str:
     if not conn_str:
         return conn_str
 
-    # Mask password
-    masked = re.sub(r'(PWD=)([^;]+)', r'\1***MASKED***', conn_str, flags=re.IGNORECASE)
-    masked = re.sub(r'(PASSWORD=)([^;]+)', r'\1***MASKED***', masked, flags=re.IGNORECASE)
-    # Partially mask UID (show first 2 chars only)
-    masked = re.sub(r'(UID=)([^;]+)', lambda m: f"{m.group(1)}{m.group(2)[:2]}***", masked, flags=re.IGNORECASE)
-    return masked
+    masked = []
+    for key, value in _parse_conn_str(conn_str):
+        if value:
+            key_upper = key.upper()
+            if key_upper in ('PWD', 'PASSWORD'):
+                value = '***MASKED***'
+            elif key_upper == 'UID':
+                # Partially mask UID (show first 2 chars only)
+                value = f"{value[:2]}***"
+        masked.append((key, value))
+
+    return _join_conn_str(masked)
 
 
+@lru_cache(maxsize=1)
 def detect_available_odbc_driver() -> str:
     """
     🔍 Auto-detect which ODBC Driver for SQL Server is installed
     Tries in order: 18 → 17 → 13 → 11 → Generic SQL Server
+    Installed drivers don't change at runtime, so the result is cached per process
+    (a failed detection raises and is not cached).
 
     Returns:
         str: Driver name (e.g., "ODBC Driver 18 for SQL Server")
@@ -92,11 +192,13 @@ def detect_available_odbc_driver() -> str:
     raise RuntimeError(error_msg)
 
 
+@lru_cache(maxsize=16)
 def fix_connection_string(conn_str: str) -> str:
     """
     🔧 Auto-fix DATABASE_URL for ODBC:
     1. Detect and use correct ODBC driver (18/17/13)
     2. Add {} around values with special characters (@, -, etc.)
+    Cached per input string - every pool is normally built from the same DATABASE_URL.
     """
     if not conn_str:
         logger.error("[DB] ❌ Empty connection string received!")
@@ -105,25 +207,28 @@ def fix_connection_string(conn_str: str) -> str:
     original = conn_str
     changes_made = []
 
-    # Always log what we received (with masked sensitive data)
-    masked = mask_sensitive_data(original)
-    logger.info(f"[DB] Received connection string ({len(original)} chars)")
-    logger.info(f"[DB] Connection string: {masked}")
+    # Log what we received (with masked sensitive data); masking is skipped above INFO
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        logger.info(f"[DB] Received connection string ({len(original)} chars)")
+        logger.info(f"[DB] Connection string: {mask_sensitive_data(original)}")
+
+    # Tokenize once; both steps below work on the parsed pairs
+    pairs = _parse_conn_str(conn_str)
 
     # Step 1: Auto-detect and replace DRIVER
     try:
         detected_driver = detect_available_odbc_driver()
-        # Replace any existing DRIVER= value with detected one
-        old_driver_match = re.search(r'DRIVER=\{([^}]+)\}', conn_str, re.IGNORECASE)
-        if old_driver_match:
-            old_driver = old_driver_match.group(1)
+        # Replace any existing DRIVER={...} value with detected one
+        driver_indexes = [
+            idx for idx, (key, value) in enumerate(pairs)
+            if value and key.upper() == 'DRIVER' and value.startswith('{') and value.endswith('}')
+        ]
+        if driver_indexes:
+            old_driver = pairs[driver_indexes[0]][1][1:-1]
             if old_driver != detected_driver:
-                conn_str = re.sub(
-                    r'DRIVER=\{[^}]+\}',
-                    f'DRIVER={{{detected_driver}}}',
-                    conn_str,
-                    flags=re.IGNORECASE
-                )
+                for idx in driver_indexes:
+                    pairs[idx] = (pairs[idx][0], f"{{{detected_driver}}}")
                 changes_made.append(f"DRIVER (changed from {old_driver} to {detected_driver})")
                 logger.info(f"[DB] Replaced DRIVER: {old_driver} → {detected_driver}")
             else:
@@ -134,54 +239,44 @@ def fix_connection_string(conn_str: str) -> str:
         logger.error(f"[DB] ❌ Driver detection failed: {e}")
         raise
 
-    # Step 2: Parse and fix special characters in values
-    parts = conn_str.split(';')
+    # Step 2: Fix special characters in values
     fixed_parts = []
 
-    for part in parts:
-        if not part.strip():
+    for key, value in pairs:
+        if value is None:
+            fixed_parts.append((key, value))
             continue
 
-        if '=' in part:
-            key, value = part.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Skip if already has brackets or braces
-            if (value.startswith('{') and value.endswith('}')) or (value.startswith('[') and value.endswith(']')):
-                fixed_parts.append(f"{key}={value}")
-                continue
-
-            # Add braces for problematic values
-            needs_braces = False
-            reason = ""
-
-            if key.upper() == 'UID' and '@' in value:
-                needs_braces = True
-                reason = "UID has @"
-            elif key.upper() == 'DATABASE' and '-' in value:
-                needs_braces = True
-                reason = "DATABASE has -"
-            elif key.upper() == 'PWD' and any(c in value for c in ['@', '!', '#', '$', '%', '^', '&', '*', '(', ')']):
-                needs_braces = True
-                reason = "PWD has special chars"
-
-            if needs_braces:
-                fixed_parts.append(f"{key}={{{value}}}")
-                if f"{key} ({reason})" not in changes_made:
-                    changes_made.append(f"{key} ({reason})")
-            else:
-                fixed_parts.append(f"{key}={value}")
+        # Skip if already has brackets or braces
+        if (value.startswith('{') and value.endswith('}')) or (value.startswith('[') and value.endswith(']')):
+            fixed_parts.append((key, value))
+            continue
+
+        # Add braces for problematic values
+        key_upper = key.upper()
+        reason = ""
+
+        if key_upper == 'UID' and '@' in value:
+            reason = "UID has @"
+        elif key_upper == 'DATABASE' and '-' in value:
+            reason = "DATABASE has -"
+        elif key_upper == 'PWD' and not _SPECIAL_CHARS.isdisjoint(value):
+            reason = "PWD has special chars"
+
+        if reason:
+            fixed_parts.append((key, f"{{{value}}}"))
+            if f"{key} ({reason})" not in changes_made:
+                changes_made.append(f"{key} ({reason})")
         else:
-            fixed_parts.append(part)
+            fixed_parts.append((key, value))
 
-    conn_str = ';'.join(fixed_parts)
+    conn_str = _join_conn_str(fixed_parts)
 
-    if changes_made:
-        logger.info(f"[DB] OK Auto-fixed: {', '.join(changes_made)}")
-        logger.info(f"[DB] Final connection string: {mask_sensitive_data(conn_str)}")
-    else:
-        logger.info(f"[DB] OK No changes needed")
+    if log_info:
+        if changes_made:
+            logger.info(f"[DB] OK Auto-fixed: {', '.join(changes_made)}")
+        else:
+            logger.info(f"[DB] OK No changes needed")
         logger.info(f"[DB] Final connection string: {mask_sensitive_data(conn_str)}")
 
     return conn_str
@@ -196,44 +291,101 @@ class ConnectionPool:
 
         # Auto-fix connection string format (adds {} around values with special chars)
         self.connection_string = fix_connection_string(connection_string)
+        # Masked DSN and a short key for it, computed once for logging. The key is
+        # hashed from the masked form so logs never carry anything derived from PWD.
+        self._masked_conn_str = mask_sensitive_data(self.connection_string)
+        self._conn_key = hashlib.blake2s(self._masked_conn_str.encode('utf-8'), digest_size=8).hexdigest()
 
         self.pool_size = max(1, min(pool_size, 50))  # ✅ Validate
         self.max_overflow = max(0, min(max_overflow, 50))
         self.timeout = max(5, min(timeout, 300))
 
-        self._pool = Queue(maxsize=self.pool_size + self.max_overflow)
+        # Idle connections; borrow/return and the counters below share one lock
+        self._pool: deque = deque()
         self._lock = Lock()
+        # Borrowers blocked on an empty pool, oldest first; a returned connection
+        # is handed straight to the head waiter through _handoff
+        self._waiters: deque = deque()
+        self._handoff: dict = {}
         self._current_size = 0
+        # Spare overflow connections reserved in _current_size but still connecting
+        self._pending = 0
         self._active_connections = 0  # ✅ Track active
+        self._closed = False
+        # Set once background warmup has finished (successfully or not)
+        self.ready = Event()
+        self._reaper_stop = Event()
 
-        logger.info(f"[ConnectionPool] Configuration: pool_size={self.pool_size}, max_overflow={self.max_overflow}, timeout={self.timeout}s")
+        logger.info(f"[ConnectionPool] Configuration: key={self._conn_key}, pool_size={self.pool_size}, max_overflow={self.max_overflow}, timeout={self.timeout}s")
 
         self._initialize_pool()
 
+        Thread(target=self._reap_expired, name="db-pool-reaper", daemon=True).start()
+
     def _initialize_pool(self):
-        """Initialize connection pool"""
+        """
+        Initialize connection pool
+        Only the first connection is created inline (validates credentials and gives
+        the first request a connection); the rest are filled in a background thread.
+        If the first connect fails, the background thread retries the full pool_size.
+        """
         logger.info(f"Initializing connection pool: size={self.pool_size}, overflow={self.max_overflow}")
-        
-        for i in range(self.pool_size):
-            try:
-                conn = self._create_connection()
-                if conn:
-                    self._pool.put(conn)
-                    self._current_size += 1
-                    logger.debug(f"Created connection {i+1}/{self.pool_size}")
-            except Exception as e:
-                logger.error(f"Failed to initialize connection {i+1}: {e}")
-        
-        if self._current_size == 0:
-            logger.error("Failed to create any connections!")
+
+        conn = self._create_connection()
+        if conn:
+            self._pool.append(conn)
+            self._current_size += 1
+            logger.debug(f"Created connection 1/{self.pool_size}")
         else:
+            # May be transient - keep warming up in the background instead of giving up
+            logger.error("Failed to create first connection, retrying in background")
+
+        remaining = self.pool_size - self._current_size
+        if remaining == 0:
+            logger.info(f"Pool initialized with {self._current_size} connections")
+            self.ready.set()
+            return
+
+        Thread(target=self._fill_remaining, args=(remaining,), name="db-pool-warmup", daemon=True).start()
+
+    def _fill_remaining(self, remaining: int):
+        """Background warmup: create the remaining connections up to pool_size"""
+        first = self.pool_size - remaining + 1
+        try:
+            # Connect in parallel - each connect is mostly network wait, so warmup
+            # takes roughly one connect latency instead of pool_size of them
+            with ThreadPoolExecutor(max_workers=remaining, thread_name_prefix="db-warmup") as executor:
+                futures = [executor.submit(self._create_connection) for _ in range(remaining)]
+
+                for i, future in enumerate(futures, start=first):
+                    try:
+                        conn = future.result()
+                        if not conn:
+                            continue
+
+                        with self._lock:
+                            # Overflow connections may have filled the pool meanwhile
+                            added = not self._closed and self._current_size < (self.pool_size + self.max_overflow)
+                            if added:
+                                self._current_size += 1
+                                self._put_idle(conn)
+
+                        if added:
+                            logger.debug(f"Created connection {i}/{self.pool_size}")
+                        else:
+                            conn.close()
+                    except Exception as e:
+                        logger.error(f"Failed to initialize connection {i}: {e}")
+
             logger.info(f"Pool initialized with {self._current_size} connections")
+        finally:
+            self.ready.set()
 
     def _create_connection(self) -> Optional[ConnectionWrapper]:
         """Bug #19 fix - Create a new database connection wrapped for lifetime tracking"""
         try:
             # Debug: Log the exact connection string being used (masked)
-            logger.info(f"[DB] Attempting connection with: {mask_sensitive_data(self.connection_string)}")
+            logger.info(f"[DB] Attempting connection with: {self._masked_conn_str}")
 
             conn = pyodbc.connect(
                 self.connection_string,
@@ -244,7 +396,7 @@ class ConnectionPool:
             return ConnectionWrapper(conn)  # Wrap connection
         except pyodbc.Error as e:
             logger.error(f"Failed to create connection: {e}")
-            logger.error(f"Connection string used: {mask_sensitive_data(self.connection_string)}")
+            logger.error(f"Connection string used: {self._masked_conn_str}")
             return None
         except Exception as e:
             logger.error(f"Unexpected error creating connection: {e}")
@@ -260,132 +412,236 @@ class ConnectionPool:
             logger.debug("Connection expired, will be recycled")
             return False
 
+        # Recently checked connections are trusted without a round trip
+        if not conn_wrapper.needs_validation():
+            return True
+
         try:
             cursor = conn_wrapper.connection.cursor()
             cursor.execute("SELECT 1")
             cursor.close()
+            conn_wrapper.last_validated_ns = time.monotonic_ns()
             return True
         except Exception as e:
             logger.warning(f"Connection validation failed: {e}")
             return False
 
-    @contextmanager
-    def get_connection(self, retry_count: int = 2):
-        """Get a connection from pool with context manager"""
-        conn = None
-        conn_acquired = False
+    def _put_idle(self, conn_wrapper: ConnectionWrapper):
+        """Hand a connection to the longest-waiting borrower or park it (caller holds _lock)"""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            self._handoff[waiter] = conn_wrapper
+            self._active_connections += 1
+            waiter.set()
+        else:
+            self._pool.append(conn_wrapper)
 
-        # Retry logic OUTSIDE the try-finally to avoid complex nesting
-        for retry_attempt in range(retry_count + 1):
-            try:
-                # Try to get from pool
-                try:
-                    conn = self._pool.get(timeout=10)
-                    logger.debug("Got connection from pool")
-                except Empty:
-                    # Pool is empty, try to create overflow connection
-                    with self._lock:
-                        if self._current_size < (self.pool_size + self.max_overflow):
-                            logger.debug("Creating overflow connection")
-                            conn = self._create_connection()
-                            if conn:
-                                self._current_size += 1
-                        else:
-                            logger.warning("Connection pool exhausted")
-                            raise ConnectionPoolExhausted("Connection pool exhausted, please wait")
+    def _create_reserved(self, count: int):
+        """Open connections for slots already reserved in _current_size and park them"""
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="db-overflow") as executor:
+            for conn in executor.map(lambda _: self._create_connection(), range(count)):
+                with self._lock:
+                    self._pending -= 1
+                    added = conn is not None and not self._closed
+                    if added:
+                        self._put_idle(conn)
+                    else:
+                        self._current_size -= 1
+                        # The slot is free again - wake the head waiter to claim it
+                        if self._waiters:
+                            self._waiters[0].set()
 
-                # Bug #19 fix - Validate connection (checks expiry and health)
-                if conn and not self._validate_connection(conn):
-                    logger.warning("Invalid or expired connection, recreating")
-                    try:
-                        conn.close()
-                    except Exception as e:
-                        logger.error(f"Failed to close connection: {e}")
+                if conn is not None and not added:
+                    conn.close()
 
-                    with self._lock:
-                        self._current_size -= 1
+    def _reap_expired(self):
+        """
+        Background sweep over idle connections in one pass
+        Closes expired connections, and idle-timed-out ones while the pool is above pool_size,
+        then reopens connections until the pool is back at pool_size.
+        """
+        while not self._reaper_stop.wait(REAPER_INTERVAL):
+            closed = []
+            with self._lock:
+                excess = self._current_size - self.pool_size
+                live = deque()
+                # Left end holds the least recently returned connections
+                for conn_wrapper in self._pool:
+                    if conn_wrapper.is_expired():
+                        closed.append(conn_wrapper)
+                        excess -= 1
+                    elif excess > 0 and conn_wrapper.is_idle():
+                        closed.append(conn_wrapper)
+                        excess -= 1
+                    else:
+                        live.append(conn_wrapper)
+                if closed:
+                    self._pool = live
+                    self._current_size -= len(closed)
+
+            for conn_wrapper in closed:
+                conn_wrapper.close()
 
-                    conn = self._create_connection()
-                    if conn:
-                        with self._lock:
-                            self._current_size += 1
+            if closed:
+                logger.debug(f"Reaper closed {len(closed)} expired/idle connections")
 
-                    if not conn:
-                        raise Exception("Failed to create valid connection")
+            # Top the pool back up to pool_size so an idle period doesn't leave
+            # the next request paying for the connect
+            with self._lock:
+                refill = 0 if self._closed else self.pool_size - self._current_size
+                if refill > 0:
+                    self._current_size += refill
+                    self._pending += refill
 
-                # Track active connection
-                if conn:
-                    with self._lock:
+            if refill > 0:
+                logger.debug(f"Reaper refilling {refill} connections")
+                self._create_reserved(refill)
+
+    def _acquire(self) -> ConnectionWrapper:
+        """Borrow a validated connection, creating an overflow one if allowed"""
+        conn = None
+        waiter = None
+        batch = 1
+        with self._lock:
+            if self._pool:
+                # LIFO: reuse the most recently returned (warmest) connection so
+                # rarely used ones age out at the left end
+                conn = self._pool.pop()
+                self._active_connections += 1
+            elif self._current_size < self.pool_size:
+                # Below base size (reaped or failed connects) - nothing to wait for,
+                # so take the free slot and connect right away
+                self._current_size += 1
+                self._active_connections += 1
+            else:
+                waiter = Event()
+                self._waiters.append(waiter)
+
+        if waiter is not None:
+            while True:
+                # Wait for a returned connection before falling back to overflow
+                waiter.wait(timeout=10)
+
+                with self._lock:
+                    conn = self._handoff.pop(waiter, None)
+                    if conn is not None:
+                        break
+
+                    # Not handed anything, so we are still queued. Spares already
+                    # connecting go to the queue head first; only waiters they
+                    # don't cover need new connections.
+                    uncovered = len(self._waiters) - self._pending
+                    remaining = (self.pool_size + self.max_overflow) - self._current_size
+                    if uncovered > 0 and remaining > 0:
+                        self._waiters.remove(waiter)
+                        # Reserve the slots now; the connects run outside the lock
+                        batch = min(OVERFLOW_BATCH_SIZE, remaining, uncovered)
+                        self._current_size += batch
+                        self._pending += batch - 1
                         self._active_connections += 1
-                    conn_acquired = True
+                        break
 
-                    # Success - yield unwrapped connection and break retry loop
-                    try:
-                        yield conn.connection  # Yield the actual pyodbc.Connection
-                    finally:
-                        # Cleanup after yield
-                        self._return_connection(conn)
-                        conn_acquired = False
+                    if self._pending == 0:
+                        self._waiters.remove(waiter)
+                        logger.warning("Connection pool exhausted")
+                        raise ConnectionPoolExhausted("Connection pool exhausted, please wait")
 
-                    # If we got here, connection was successful
-                    break
+                    # A spare is on its way - stay queued for it
+                    waiter.clear()
 
-            except Exception as e:
-                # Clean up connection if it was acquired but not yet returned
-                if conn_acquired and conn:
-                    try:
-                        self._return_connection(conn)
-                        conn_acquired = False
-                    except Exception as cleanup_error:
-                        logger.error(f"Error during connection cleanup: {cleanup_error}")
+        if conn is None:
+            logger.debug(f"Creating connections (batch of {batch})")
+            if batch > 1:
+                Thread(target=self._create_reserved, args=(batch - 1,), daemon=True).start()
+
+            conn = self._create_connection()
+            if not conn:
+                with self._lock:
+                    self._current_size -= 1
+                    self._active_connections -= 1
+                raise Exception("Failed to create connection")
+
+        logger.debug("Got connection from pool")
+
+        # Bug #19 fix - Validate connection (checks expiry and health)
+        if not self._validate_connection(conn):
+            logger.warning("Invalid or expired connection, recreating")
+            conn.close()
+
+            # The replacement takes over the same slot, so counters stay as they are
+            conn = self._create_connection()
+            if not conn:
+                with self._lock:
+                    self._current_size -= 1
+                    self._active_connections -= 1
+                raise Exception("Failed to create valid connection")
+
+        return conn
 
-                # Check if we should retry
+    @contextmanager
+    def get_connection(self, retry_count: int = 2):
+        """Get a connection from pool with context manager"""
+        conn = None
+
+        # Only acquisition is retried - errors raised by the caller's block propagate as-is
+        for retry_attempt in range(retry_count + 1):
+            try:
+                conn = self._acquire()
+                break
+            except Exception as e:
                 if retry_attempt < retry_count:
                     logger.error(f"Error getting connection (attempt {retry_attempt + 1}/{retry_count + 1}): {e}")
                     time.sleep(min(0.5 * (retry_attempt + 1), 3.0))  # Max 3 second backoff
-                    continue
                 else:
                     # Out of retries, raise the error
                     logger.error(f"Failed to get connection after {retry_count + 1} attempts")
                     raise
 
+        try:
+            yield conn.connection  # Yield the actual pyodbc.Connection
+        except pyodbc.Error:
+            # The link may have died mid-use - force a SELECT 1 before the next borrow
+            conn.last_validated_ns = 0
+            raise
+        finally:
+            self._return_connection(conn)
+
     def _return_connection(self, conn_wrapper: ConnectionWrapper):
         """Bug #19 fix - Return connection wrapper to pool or close it"""
         if not conn_wrapper:
             return
 
-        # Decrement active connections
+        # Health is checked on the next borrow; on return only the lifetime matters
+        expired = conn_wrapper.is_expired()
+        conn_wrapper.last_returned_ns = time.monotonic_ns()
+
         with self._lock:
             self._active_connections -= 1
-
-        # Try to return to pool or close
-        try:
-            if self._validate_connection(conn_wrapper):
-                try:
-                    self._pool.put_nowait(conn_wrapper)
-                    logger.debug("Returned connection to pool")
-                except Exception as e:
-                    logger.error(f"Failed to return connection to pool: {e}")
-                    conn_wrapper.close()
-                    with self._lock:
-                        self._current_size -= 1
-                    logger.debug("Pool full, closed connection")
+            keep = not expired and not self._closed
+            if keep:
+                self._put_idle(conn_wrapper)
             else:
-                # Invalid or expired connection, close it
-                conn_wrapper.close()
-                with self._lock:
-                    self._current_size -= 1
-                logger.debug("Closed invalid connection")
-        except Exception as e:
-            logger.error(f"Error returning connection: {e}")
+                self._current_size -= 1
+
+        if keep:
+            logger.debug("Returned connection to pool")
+        else:
+            conn_wrapper.close()
+            logger.debug("Closed returned connection (expired or pool closed)")
 
     def get_stats(self) -> dict:
         """Get pool statistics"""
+        # One short critical section gives a consistent snapshot of the counters
+        with self._lock:
+            current_size = self._current_size
+            active_connections = self._active_connections
+            available = len(self._pool)
+
         return {
             "pool_size": self.pool_size,
-            "current_size": self._current_size,
-            "active_connections": self._active_connections,
-            "available": self._pool.qsize(),
+            "current_size": current_size,
+            "active_connections": active_connections,
+            "available": available,
             "max_overflow": self.max_overflow
         }
 
@@ -393,18 +649,22 @@ class ConnectionPool:
         """Bug #19 fix - Close all connection wrappers in pool"""
         logger.info("Closing all connections")
 
+        self._reaper_stop.set()
+
+        with self._lock:
+            self._closed = True
+            idle = list(self._pool)
+            self._pool.clear()
+            self._current_size -= len(idle)
+
         closed_count = 0
-        while not self._pool.empty():
+        for conn_wrapper in idle:
             try:
-                conn_wrapper = self._pool.get_nowait()
                 conn_wrapper.close()  # Use wrapper's close method
                 closed_count += 1
-            except Empty:
-                break
             except Exception as e:
                 logger.error(f"Error closing connection: {e}")
-        
-        self._current_size = 0
+
         logger.info(f"Closed {closed_count} connections")
         
         if self._active_connections > 0:
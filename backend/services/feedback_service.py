@@ -1,8 +1,8 @@
 from typing import Dict, List, Optional, TYPE_CHECKING
 import logging
-import json
 import os
 from pathlib import Path
+from config import load_json_file
 
 if TYPE_CHECKING:
     from database import DatabaseManager
@@ -26,8 +26,8 @@ class FeedbackService:
 
         try:
             if api_config_path and api_config_path.exists():
-                with open(api_config_path, "r", encoding="utf-8") as f:
-                    api_config = json.load(f)
+                # Shared, mtime-checked parse of api_config.json
+                api_config = load_json_file(api_config_path)
                 self.log_msgs = api_config.get("log_messages", {})
                 self.error_msgs = api_config.get("error_messages", {})
             else:
@@ -38,6 +38,19 @@ class FeedbackService:
             self.log_msgs = {}
             self.error_msgs = {}
 
+        # Resolve message templates once; call sites just invoke the bound .format
+        # (templates use {} placeholders, so INFO calls check the level before formatting)
+        log_msgs = self.log_msgs
+        self._fmt_submitted = log_msgs.get("feedback_submitted_successfully", "Feedback submitted successfully: ID {}").format
+        self._fmt_submit_error = self.error_msgs.get("feedback_submit_error", "Error submitting feedback: {}").format
+        self._fmt_retrieved = log_msgs.get("feedback_retrieved", "Retrieved {} public feedback items").format
+        self._fmt_get_error = log_msgs.get("feedback_get_error", "Error getting public feedback: {}").format
+        self._fmt_admin_retrieved = log_msgs.get("admin_feedback_retrieved", "Retrieved {} admin feedback items").format
+        self._fmt_admin_get_error = log_msgs.get("admin_feedback_get_error", "Error getting admin feedback: {}").format
+        self._fmt_deleted = log_msgs.get("feedback_deleted_success", "Feedback {} deleted successfully").format
+        self._fmt_delete_failed = log_msgs.get("feedback_delete_failed", "Failed to delete feedback {}").format
+        self._fmt_delete_error = log_msgs.get("feedback_delete_error", "Error deleting feedback {}: {}").format
+
     def submit_feedback(
         self,
         text: str,
@@ -63,48 +76,43 @@ class FeedbackService:
             )
 
             if result:
-                msg = self.log_msgs.get("feedback_submitted_successfully", "Feedback submitted successfully: ID {}")
-                logger.info(msg.format(result))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(self._fmt_submitted(result))
                 return result
             return None
         except Exception as e:
-            msg = self.error_msgs.get("feedback_submit_error", "Error submitting feedback: {}")
-            logger.error(msg.format(e))
+            logger.error(self._fmt_submit_error(e))
             return None
 
     def get_public_feedback(self, limit: int = 50) -> List[Dict]:
         try:
             feedback_list = self.db.get_public_feedback(limit)
-            msg = self.log_msgs.get("feedback_retrieved", "Retrieved {} public feedback items")
-            logger.info(msg.format(len(feedback_list)))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(self._fmt_retrieved(len(feedback_list)))
             return feedback_list
         except Exception as e:
-            msg = self.log_msgs.get("feedback_get_error", "Error getting public feedback: {}")
-            logger.error(msg.format(e))
+            logger.error(self._fmt_get_error(e))
             return []
 
     def get_admin_feedback(self, limit: int = 100) -> List[Dict]:
         try:
             feedback_list = self.db.get_admin_feedback(limit)
-            msg = self.log_msgs.get("admin_feedback_retrieved", "Retrieved {} admin feedback items")
-            logger.info(msg.format(len(feedback_list)))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(self._fmt_admin_retrieved(len(feedback_list)))
             return feedback_list
         except Exception as e:
-            msg = self.log_msgs.get("admin_feedback_get_error", "Error getting admin feedback: {}")
-            logger.error(msg.format(e))
+            logger.error(self._fmt_admin_get_error(e))
             return []
 
     def delete_feedback(self, feedback_id: int) -> bool:
         try:
             success = self.db.delete_feedback(feedback_id)
             if success:
-                msg = self.log_msgs.get("feedback_deleted_success", "Feedback {} deleted successfully")
-                logger.info(msg.format(feedback_id))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(self._fmt_deleted(feedback_id))
             else:
-                msg = self.log_msgs.get("feedback_delete_failed", "Failed to delete feedback {}")
-                logger.warning(msg.format(feedback_id))
+                logger.warning(self._fmt_delete_failed(feedback_id))
             return success
         except Exception as e:
-            msg = self.log_msgs.get("feedback_delete_error", "Error deleting feedback {}: {}")
-            logger.error(msg.format(feedback_id, e))
+            logger.error(self._fmt_delete_error(feedback_id, e))
             return False
\ No newline at end of file
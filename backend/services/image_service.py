@@ -3,15 +3,49 @@ import io
 import os
 import time
 import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
+import PIL
 from PIL import Image
 from huggingface_hub import InferenceClient
 
 logger = logging.getLogger(__name__)
 
+# Dedicated pool for PIL decode/resize/encode so image CPU work never queues
+# behind (or starves) blocking DB and network calls on the default executor
+_IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="image-cpu")
+
+# Pillow-SIMD is a drop-in replacement that publishes versions like "9.5.0.post1"
+PIL_SIMD = ".post" in PIL.__version__
+
+
+@lru_cache(maxsize=16)
+def _ensure_dir(path: str) -> None:
+    """Create an output directory once per process"""
+    os.makedirs(path, exist_ok=True)
+
 
 class ImageService:
-    STYLE_PROMPTS = {
+    # Preprocessed uploads kept so retries / other styles on the same photo skip PIL work
+    PREPARED_CACHE_MAX_ENTRIES = 64
+    PREPARED_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    # Small, already model-sized JPEG uploads are sent to the model untouched
+    SMALL_JPEG_PASSTHROUGH_BYTES = 512 * 1024
+    # ...but only if the header carries nothing beyond these harmless JFIF/Adobe keys
+    # and segments; anything else (EXIF, XMP, IPTC, comments, ICC) is stripped by re-encoding
+    PASSTHROUGH_INFO_KEYS = frozenset({
+        'jfif', 'jfif_version', 'jfif_unit', 'jfif_density', 'dpi',
+        'adobe', 'adobe_transform', 'progressive', 'progression',
+    })
+    PASSTHROUGH_APP_SEGMENTS = frozenset({'APP0', 'APP14'})
+
+    # Stripped once at class load instead of on every request
+    STYLE_PROMPTS = {style: prompt.strip() for style, prompt in {
         'anime': """
         Create a cartoon-style portrait of the person in the uploaded photo: Keep the same outfit and pose as in the original image. Use a clean white background. The style should be semi-realistic or stylized cartoon, but the facial features and clothing must closely resemble the original photo.
         """,
@@ -41,13 +75,10 @@ class ImageService:
         The character should be recognizable from the original photo but transformed into
         an extremely cute cartoon with the specified uniform and logo.
         """,
-    }
+    }.items()}
 
     def _get_prompt_for_style(self, style: str) -> str:
-        prompt = self.STYLE_PROMPTS.get(style)
-        if not prompt:
-            prompt = self.STYLE_PROMPTS['anime']
-        return prompt.strip()
+        return self.STYLE_PROMPTS.get(style) or self.STYLE_PROMPTS['anime']
 
     def __init__(
         self,
@@ -63,8 +94,13 @@ class ImageService:
         self.client = InferenceClient(
             api_key=api_token,
         )
+        # blake2b(upload) -> (processed bytes, error); LRU bounded by entries and bytes
+        self._prepared_cache: "OrderedDict[bytes, Tuple[Optional[bytes], Optional[str]]]" = OrderedDict()
+        self._prepared_cache_bytes = 0
+        self._prepared_cache_lock = threading.Lock()
         logger.info(f"✅ ImageService initialized with model: {model_name}")
         logger.info(f"   Using HuggingFace Inference API (free tier)")
+        logger.info(f"   Pillow {PIL.__version__} ({'SIMD build' if PIL_SIMD else 'standard build'})")
 
     def _get_error_message(self, key: str, **kwargs) -> str:
         if self.api_config:
@@ -79,38 +115,86 @@ class ImageService:
                 return template
         return key
 
-    def _validate_image(self, image_data: bytes) -> Tuple[bool, Optional[str]]:
+    def _prepare_image(self, image_data: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+        """Validate and preprocess an upload in one pass over a single PIL image"""
         try:
             img = Image.open(io.BytesIO(image_data))
             if img.format not in ['JPEG', 'PNG', 'WEBP']:
-                return False, self._get_error_message("unsupported_format", format=img.format)
+                return None, self._get_error_message("unsupported_format", format=img.format)
             if len(image_data) > 10 * 1024 * 1024:
-                return False, self._get_error_message("image_too_large")
+                return None, self._get_error_message("image_too_large")
             width, height = img.size
             if width < 100 or height < 100:
-                return False, self._get_error_message("image_too_small")
+                return None, self._get_error_message("image_too_small")
             if width > 4096 or height > 4096:
-                return False, self._get_error_message("image_too_large_dimensions")
-            return True, None
+                return None, self._get_error_message("image_too_large_dimensions")
         except Exception as e:
             logger.error(f"Image validation error: {e}")
-            return False, self._get_error_message("invalid_image_file", error=str(e))
+            return None, self._get_error_message("invalid_image_file", error=str(e))
+
+        max_size = 1024
+        if (
+            img.format == 'JPEG'
+            and img.mode == 'RGB'
+            and max(img.size) <= max_size
+            and len(image_data) < self.SMALL_JPEG_PASSTHROUGH_BYTES
+            and img.info.keys() <= self.PASSTHROUGH_INFO_KEYS
+            and all(segment in self.PASSTHROUGH_APP_SEGMENTS for segment, _ in img.applist)
+        ):
+            # Already model-sized RGB JPEG with no metadata (GPS, device, creator) -
+            # Image.open only read the header, so skip the decode/re-encode and
+            # ship the upload as-is. Uploads with metadata are re-encoded below,
+            # which drops it before the bytes leave for the HF endpoint.
+            return image_data, None
 
-    def _preprocess_image(self, image_data: bytes) -> bytes:
         try:
-            img = Image.open(io.BytesIO(image_data))
+            if img.format == 'JPEG' and max(img.size) > max_size:
+                # Let libjpeg decode straight to RGB at a 1/2, 1/4 or 1/8 DCT scale
+                # that still covers max_size; thumbnail() below does the exact fit
+                img.draft('RGB', (max_size, max_size))
             if img.mode != 'RGB':
                 img = img.convert('RGB')
-            max_size = 1024
             if max(img.size) > max_size:
-                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+                # BILINEAR after a box reduce is visually equivalent to LANCZOS at
+                # model-input size and several times cheaper
+                img.thumbnail((max_size, max_size), Image.Resampling.BILINEAR, reducing_gap=2.0)
                 logger.info(f"Resized image to {img.size}")
             output = io.BytesIO()
-            img.save(output, format='JPEG', quality=90, optimize=True)
-            return output.getvalue()
+            # save() drops EXIF/XMP/ICC unless passed in, but copies a COM comment
+            # from img.info - blank it so no upload metadata reaches the endpoint
+            img.save(output, format='JPEG', quality=90, optimize=True, comment=b"")
+            return output.getvalue(), None
         except Exception as e:
             logger.error(f"Image preprocessing error: {e}")
-            return image_data
+            return image_data, None
+
+    def _prepare_image_cached(self, image_data: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+        """_prepare_image with an LRU cache keyed by the upload's content hash"""
+        key = hashlib.blake2b(image_data, digest_size=16).digest()
+
+        with self._prepared_cache_lock:
+            cached = self._prepared_cache.get(key)
+            if cached is not None:
+                self._prepared_cache.move_to_end(key)
+                return cached
+
+        result = self._prepare_image(image_data)
+        size = len(result[0] or b"")
+        if size > self.PREPARED_CACHE_MAX_BYTES:
+            return result
+
+        with self._prepared_cache_lock:
+            if key not in self._prepared_cache:
+                self._prepared_cache[key] = result
+                self._prepared_cache_bytes += size
+                while (
+                    len(self._prepared_cache) > self.PREPARED_CACHE_MAX_ENTRIES
+                    or self._prepared_cache_bytes > self.PREPARED_CACHE_MAX_BYTES
+                ):
+                    _, (evicted, _) = self._prepared_cache.popitem(last=False)
+                    self._prepared_cache_bytes -= len(evicted or b"")
+
+        return result
 
     async def generate_image(
         self,
@@ -120,11 +204,12 @@ class ImageService:
     ) -> Tuple[Optional[bytes], Optional[str]]:
         logger.info(f"🎨 Starting image generation for session {session_id[:8]}...")
         logger.info(f"   Style: {style}")
-        is_valid, error = self._validate_image(image_data)
-        if not is_valid:
+        # PIL decode/resize/encode is CPU-bound - keep it off the event loop
+        loop = asyncio.get_running_loop()
+        processed_image, error = await loop.run_in_executor(_IMAGE_EXECUTOR, self._prepare_image_cached, image_data)
+        if error:
             logger.warning(f"❌ Image validation failed: {error}")
             return None, error
-        processed_image = self._preprocess_image(image_data)
         logger.info(f"✅ Image preprocessed ({len(processed_image)} bytes)")
         try:
             prompt = self._get_prompt_for_style(style)
@@ -132,19 +217,21 @@ class ImageService:
             logger.info(f"   Model: {self.model_name}")
             logger.info(f"   Prompt: {prompt[:100]}...")
             
-            def _generate():
-                return self.client.image_to_image(
+            def _generate() -> Optional[bytes]:
+                image = self.client.image_to_image(
                     processed_image,
                     prompt=prompt,
                     model=self.model_name,
                 )
-            
-            image = await asyncio.to_thread(_generate)
-            
-            if image:
+                if not image:
+                    return None
                 output = io.BytesIO()
                 image.save(output, format='PNG')
-                generated_image = output.getvalue()
+                return output.getvalue()
+            
+            generated_image = await asyncio.to_thread(_generate)
+            
+            if generated_image:
                 logger.info(f"✅ Image generated successfully ({len(generated_image)} bytes)")
                 return generated_image, None
             else:
@@ -169,18 +256,21 @@ class ImageService:
                     return None, error_template.format(error=error_msg[:200])
                 return None, error_template
 
-    def save_generated_image(
+    async def save_generated_image(
         self,
         image_data: bytes,
         session_id: str,
         output_dir: str = ".cache/generated"
     ) -> Optional[str]:
         try:
-            os.makedirs(output_dir, exist_ok=True)
-            filename = f"image_{session_id}_{int(time.time())}.png"
-            filepath = os.path.join(output_dir, filename)
-            with open(filepath, 'wb') as f:
-                f.write(image_data)
+            filepath = os.path.join(output_dir, f"image_{session_id}_{int(time.time())}.png")
+
+            def _write() -> None:
+                _ensure_dir(output_dir)
+                Path(filepath).write_bytes(image_data)
+
+            # Disk writes can stall on slow or network mounts - keep them off the event loop
+            await asyncio.to_thread(_write)
             logger.info(f"💾 Saved generated image: {filepath}")
             return filepath
         except Exception as e:
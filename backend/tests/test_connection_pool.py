@@ -0,0 +1,123 @@
+"""
+ConnectionPool behaviour tests
+pyodbc.connect is replaced with an in-memory fake, so no database or ODBC driver is needed
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pyodbc = pytest.importorskip("pyodbc")
+
+from services import connection_pool  # noqa: E402
+from services.connection_pool import ConnectionPool  # noqa: E402
+
+CONN_STR = "DRIVER={ODBC Driver 18 for SQL Server};SERVER=db;DATABASE=app;UID=user;PWD=secret"
+
+
+class FakeCursor:
+    def execute(self, query):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor()
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_connect(monkeypatch):
+    """Route pyodbc.connect to FakeConnection; calls are recorded"""
+    calls = []
+
+    def connect(conn_str, timeout=None, autocommit=None):
+        calls.append(conn_str)
+        return FakeConnection()
+
+    monkeypatch.setattr(pyodbc, "connect", connect)
+    monkeypatch.setattr(pyodbc, "drivers", lambda: ["ODBC Driver 18 for SQL Server"])
+    return calls
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def factory(**kwargs):
+        pool = ConnectionPool(CONN_STR, **kwargs)
+        pools.append(pool)
+        assert pool.ready.wait(5)
+        return pool
+
+    yield factory
+
+    for pool in pools:
+        pool.close_all()
+
+
+def test_borrow_after_idle_past_lifetime_does_not_stall(monkeypatch, fake_connect, make_pool):
+    monkeypatch.setattr(connection_pool, "_MAX_LIFETIME_NS", int(0.5 * 1e9))
+    monkeypatch.setattr(connection_pool, "REAPER_INTERVAL", 0.2)
+    pool = make_pool(pool_size=2, max_overflow=2, timeout=5)
+
+    # Idle long enough for every connection to expire and be reaped at least once
+    time.sleep(1.5)
+    stats = pool.get_stats()
+    assert stats["current_size"] == pool.pool_size
+
+    start = time.monotonic()
+    with pool.get_connection() as conn:
+        assert isinstance(conn, FakeConnection)
+    assert time.monotonic() - start < 1
+
+
+def test_borrow_below_pool_size_connects_immediately(monkeypatch, fake_connect, make_pool):
+    monkeypatch.setattr(connection_pool, "REAPER_INTERVAL", 3600)
+    pool = make_pool(pool_size=2, max_overflow=0, timeout=5)
+
+    # Simulate connections lost without replacement (e.g. reaped before a refill)
+    with pool._lock:
+        lost = list(pool._pool)
+        pool._pool.clear()
+        pool._current_size -= len(lost)
+
+    start = time.monotonic()
+    with pool.get_connection() as conn:
+        assert isinstance(conn, FakeConnection)
+    assert time.monotonic() - start < 1
+    assert pool.get_stats()["current_size"] == 1
+
+
+def test_failed_first_connect_still_warms_up(monkeypatch, make_pool):
+    monkeypatch.setattr(connection_pool, "REAPER_INTERVAL", 3600)
+    attempts = []
+
+    def flaky_connect(conn_str, timeout=None, autocommit=None):
+        attempts.append(conn_str)
+        if len(attempts) == 1:
+            raise pyodbc.Error("08001", "transient login timeout")
+        return FakeConnection()
+
+    monkeypatch.setattr(pyodbc, "connect", flaky_connect)
+    monkeypatch.setattr(pyodbc, "drivers", lambda: ["ODBC Driver 18 for SQL Server"])
+    pool = make_pool(pool_size=2, max_overflow=0, timeout=5)
+
+    assert pool.get_stats()["current_size"] == pool.pool_size
+
+    start = time.monotonic()
+    with pool.get_connection() as conn:
+        assert isinstance(conn, FakeConnection)
+    assert time.monotonic() - start < 1
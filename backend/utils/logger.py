@@ -11,6 +11,11 @@ from typing import Optional, Dict, Any
 from contextvars import ContextVar
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Context variable for request ID (thread-safe)
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
@@ -46,6 +51,12 @@ class StructuredFormatter(logging.Formatter):
             log_data["file"] = f"{record.filename}:{record.lineno}"
             log_data["function"] = record.funcName
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data, default=str).decode("utf-8")
+            except TypeError:
+                # e.g. ints beyond 64 bits or non-str keys in extra_data
+                pass
         return json.dumps(log_data, default=str)
 
 